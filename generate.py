@@ -2,12 +2,10 @@ import json
 import multiprocessing as mp
 import sys
 import csv
-import copy
-import tempfile
+import os
 import time
 from dataclasses import dataclass
-from multiprocessing import Value, Lock, Manager
-from multiprocessing.managers import DictProxy
+from multiprocessing.connection import wait
 from pathlib import Path
 from typing import Optional
 
@@ -17,23 +15,27 @@ STATIONS_FILE = "stations.json"
 RESULTS_DIR = "results"
 DATA_DIR = "data"
 
+# Forked workers inherit the loaded station tables instead of re-importing
+# this module. Other platforms keep spawn, where fork is unsafe or missing.
+MP_CONTEXT = mp.get_context("fork" if sys.platform == "linux" else "spawn")
+
 
 @dataclass
 class StationResult:
-    min_temp: float
-    max_temp: float
-    sum_temp: float
-    count: int
+    """
+    Per-station statistics as parallel arrays indexed like STATION_NAMES.
 
-    def update(self, other: "StationResult"):
-        if other.max_temp > self.max_temp:
-            self.max_temp = other.max_temp
+    Temperatures are integers in tenths of a degree, so aggregation is
+    exact and only the CSV output divides by 10.
+    """
 
-        if other.min_temp < self.min_temp:
-            self.min_temp = other.min_temp
+    # Spelled out rather than dataclass(slots=True) to keep Python 3.9.
+    __slots__ = ("min_temp", "max_temp", "sum_temp", "count")
 
-        self.count += other.count
-        self.sum_temp += other.sum_temp
+    min_temp: np.ndarray
+    max_temp: np.ndarray
+    sum_temp: np.ndarray
+    count: np.ndarray
 
 
 class Colors:
@@ -73,33 +75,66 @@ def load_and_prepare_stations() -> tuple[np.ndarray, np.ndarray, np.ndarray, int
 
 
 STATION_NAMES, STATION_TEMPS, TEMP_LOOKUP, TEMP_OFFSET = load_and_prepare_stations()
-POOL_SIZE = 5_000_000
+# Temperature of each TEMP_LOOKUP entry in tenths of a degree.
+TEMP_TENTHS = np.arange(len(TEMP_LOOKUP), dtype=np.int64) - TEMP_OFFSET
+# Both tables have well under 65536 entries, so batch indices fit in 16 bits.
+INDEX_DTYPE = np.uint16
+# Spacing between per-worker progress counters, in 8-byte slots, so that
+# each counter sits on its own 64-byte cache line.
+PROGRESS_STRIDE = 8
+
 
-GLOBAL_STATION_INDICES = np.random.randint(0, len(STATION_NAMES), size=POOL_SIZE)
-GLOBAL_TEMP_INDICES = np.random.randint(0, len(TEMP_LOOKUP), size=POOL_SIZE)
+ROW_COUNT_SCALES = ((1_000_000_000, "b"), (1_000_000, "m"), (1_000, "k"))
 
 
 def format_row_count(num_rows):
     """Convert row count to human-readable suffix for filename."""
-    if num_rows >= 1_000_000_000:
-        if num_rows % 1_000_000_000 == 0:
-            return f"{num_rows // 1_000_000_000}b"
-        else:
-            return f"{num_rows / 1_000_000_000:.1f}b"
+    for scale, suffix in ROW_COUNT_SCALES:
+        if num_rows >= scale:
+            whole, remainder = divmod(num_rows, scale)
+            if remainder == 0:
+                return f"{whole}{suffix}"
+            return f"{num_rows / scale:.1f}{suffix}"
+
+    return str(num_rows)
 
-    if num_rows >= 1_000_000:
-        if num_rows % 1_000_000 == 0:
-            return f"{num_rows // 1_000_000}m"
-        else:
-            return f"{num_rows / 1_000_000:.1f}m"
 
-    if num_rows >= 1_000:
-        if num_rows % 1_000 == 0:
-            return f"{num_rows // 1_000}k"
+def write_at(fd: int, data: memoryview, offset: int) -> None:
+    """Write all of `data` to `fd` starting at `offset`."""
+    while data:
+        if hasattr(os, "pwrite"):
+            written = os.pwrite(fd, data, offset)
         else:
-            return f"{num_rows / 1_000:.1f}k"
-    else:
-        return str(num_rows)
+            os.lseek(fd, offset, os.SEEK_SET)
+            written = os.write(fd, data)
+        data = data[written:]
+        offset += written
+
+
+def drop_from_page_cache(fd: int, offset: int = 0, length: int = 0) -> None:
+    """
+    Ask the kernel to evict a byte range of `fd` from the page cache.
+
+    On Linux this also starts writeback of dirty pages in the range, so
+    calling it right after a write keeps dirty memory from piling up. A
+    length of 0 means "to the end of the file". No-op where
+    posix_fadvise is unavailable.
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+
+
+def pin_to_cpu(worker_id: int) -> None:
+    """
+    Pin the calling process to one of the CPUs it is allowed to run on.
+
+    Workers are spread round-robin over the inherited CPU set so they stop
+    migrating between cores mid-run. No-op where affinity is unsupported.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
 
 
 class FileGenerator:
@@ -108,7 +143,6 @@ class FileGenerator:
         self,
         num_rows,
         file_path: str,
-        temp_folder: str,
         num_workers: int,
         monitor_threshold: int = 5_000_000,
         results_path: Optional[str] = None,
@@ -116,41 +150,54 @@ class FileGenerator:
     ) -> None:
         self.num_rows = num_rows
         self.file_path = file_path
-        self.temp_folder = temp_folder
         self.num_workers = num_workers
         self.monitor_threshold = monitor_threshold
         self.rows_per_worker = num_rows // num_workers
-        self.progress_counter = Value("i", 0)
-        self.progress_lock = Lock()
+        # One counter per worker, each written only by its owner, so no lock
+        # is needed on the batch path. Counters are PROGRESS_STRIDE apart so
+        # workers never write to the same cache line.
+        self.progress_counters = MP_CONTEXT.RawArray("Q", num_workers * PROGRESS_STRIDE)
+        self.write_offset = MP_CONTEXT.Value("q", 0)
+        # Per-worker station stats in shared memory, one array per
+        # StationResult field and one row of stations per worker. Workers
+        # fill their own row in place, so results are never pickled back.
+        self.shared_stats = tuple(
+            MP_CONTEXT.RawArray("q", num_workers * len(STATION_NAMES)) for _ in range(4)
+        )
+        limits = np.iinfo(np.int64)
+        for worker_id in range(num_workers):
+            empty = self.__worker_stats(worker_id)
+            empty.min_temp[:] = limits.max
+            empty.max_temp[:] = limits.min
         self.results_path = results_path
         self.worker_batch_size = worker_batch_size
-        self.station_stats: dict[str, StationResult] = {}
+        self.station_stats: Optional[StationResult] = None
 
     def start(self):
         """
         Start the file generation process.
+
+        Raises:
+            RuntimeError: If a worker process exits abnormally; the data file
+                and any results file at results_path are removed
         """
         self.__print_start()
-        temp_files = []
+        self.__create_output_file()
         processes = []
-        return_dict = Manager().dict()
         n = self.num_workers
+        seeds = np.random.SeedSequence().spawn(n)
 
         for i in range(n):
             worker_rows = self.rows_per_worker
             if i == n - 1:
                 worker_rows = self.num_rows - (self.rows_per_worker * (n - 1))
 
-            temp_filename = str(Path(self.temp_folder) / f".temp_{i}.txt")
-            temp_files.append(temp_filename)
-
-            p = mp.Process(
+            p = MP_CONTEXT.Process(
                 target=self._worker,
                 args=(
                     i,
                     worker_rows,
-                    temp_filename,
-                    return_dict,
+                    seeds[i],
                 ),
             )
             p.start()
@@ -161,88 +208,175 @@ class FileGenerator:
         for p in processes:
             p.join()
 
-        merge_start = time.time()
-        self.__aggregate_stats(return_dict)
-        self.__merge_temp_files(temp_files)
+        # A worker that died leaves its reserved range unwritten and its
+        # stats missing, so neither the data nor the results can be trusted.
+        failed = [i for i, p in enumerate(processes) if p.exitcode != 0]
+        if failed:
+            Path(self.file_path).unlink(missing_ok=True)
+            # A results file from an earlier run would no longer match
+            if self.results_path:
+                Path(self.results_path).unlink(missing_ok=True)
+            raise RuntimeError(f"worker(s) {failed} exited abnormally")
+
+        finalize_start = time.time()
+        os.truncate(self.file_path, self.write_offset.value)
+        self.__aggregate_stats()
         self.__write_results_csv()
         self.__print_write_time(start_time)
 
-        with self.progress_lock:
-            actual_rows = self.progress_counter.value
+        actual_rows = self.__rows_generated()
         print(f"\nGenerated {actual_rows:,} rows")
 
-        self.__print_final_stats(start_time, merge_start)
+        self.__print_final_stats(start_time, finalize_start)
 
         return processes
 
     def _worker(
-        self, worker_id: int, num_rows: int, temp_file: str, return_dict: DictProxy
+        self,
+        worker_id: int,
+        num_rows: int,
+        seed: np.random.SeedSequence,
     ) -> None:
+        pin_to_cpu(worker_id)
+        rng = np.random.default_rng(seed)
+        progress_slot = worker_id * PROGRESS_STRIDE
         rows_cnt = 0
-        n = len(STATION_NAMES)
-        w_min = np.full(n, 9999.0, dtype=np.float32)
-        w_max = np.full(n, -9999.0, dtype=np.float32)
-        w_sum = np.zeros(n, dtype=np.float64)
-        w_count = np.zeros(n, dtype=np.int32)
-
-        with open(temp_file, "wb", buffering=8192 * 1024) as f:
+        n_temps = len(TEMP_LOOKUP)
+        # Row counts per (station, temp) pair; every statistic is derived
+        # from this once the worker is done.
+        histogram = np.zeros(len(STATION_NAMES) * n_temps, dtype=np.int64)
+        parts = np.empty(2 * self.worker_batch_size, dtype=object)
+        # Scratch for histogram cell ids, reused across batches. int32 since
+        # station * n_temps overflows the 16-bit index dtype.
+        cells = np.empty(self.worker_batch_size, dtype=np.int32)
+
+        fd = os.open(self.file_path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+        try:
             while rows_cnt < num_rows:
                 batch_size = min(self.worker_batch_size, num_rows - rows_cnt)
 
-                st_indices, temp_indices = self._get_batch_indices(batch_size)
+                st_indices, temp_indices = self._get_batch_indices(rng, batch_size)
 
-                lines = STATION_NAMES[st_indices] + TEMP_LOOKUP[temp_indices]
-                batch_bytes = b"".join(lines.tolist())
-                f.write(batch_bytes)
+                batch_bytes = self._pack_rows(st_indices, temp_indices, parts)
+                offset = self.__reserve(len(batch_bytes))
+                write_at(fd, memoryview(batch_bytes), offset)
+                drop_from_page_cache(fd, offset, len(batch_bytes))
 
-                actual_temps = (temp_indices - TEMP_OFFSET) / 10.0
-
-                np.minimum.at(w_min, st_indices, actual_temps)
-                np.maximum.at(w_max, st_indices, actual_temps)
-                np.add.at(w_sum, st_indices, actual_temps)
-                np.add.at(w_count, st_indices, 1)
+                batch_cells = cells[:batch_size]
+                np.multiply(st_indices, n_temps, out=batch_cells, dtype=np.int32)
+                np.add(batch_cells, temp_indices, out=batch_cells)
+                histogram += np.bincount(batch_cells, minlength=histogram.size)
 
                 rows_cnt += batch_size
 
-                with self.progress_lock:
-                    self.progress_counter.value += batch_size
+                self.progress_counters[progress_slot] += batch_size
+        finally:
+            # Evict whatever writeback has finished with by now.
+            drop_from_page_cache(fd)
+            os.close(fd)
 
-        worker_result = {}
+        self._summarize_histogram(histogram, self.__worker_stats(worker_id))
 
-        active_indices = np.where(w_count > 0)[0]
+    @staticmethod
+    def _summarize_histogram(histogram: np.ndarray, out: StationResult) -> None:
+        """
+        Reduce a (station, temp) count histogram to per-station results.
 
-        for idx in active_indices:
-            raw_name: bytes = STATION_NAMES[idx]  # type: ignore[assignment]
-            name = raw_name.decode("utf-8")[:-1]
+        The results are written into `out`. Stations that never appeared get
+        int64 max/min extremes so they drop out when results from several
+        workers are merged.
+        """
+        counts = histogram.reshape(len(STATION_NAMES), len(TEMP_LOOKUP))
+        seen = counts > 0
+
+        w_count = counts.sum(axis=1)
+        active = w_count > 0
+        w_min = TEMP_TENTHS[seen.argmax(axis=1)]
+        w_max = TEMP_TENTHS[len(TEMP_LOOKUP) - 1 - seen[:, ::-1].argmax(axis=1)]
+        limits = np.iinfo(np.int64)
+
+        np.copyto(out.min_temp, np.where(active, w_min, limits.max))
+        np.copyto(out.max_temp, np.where(active, w_max, limits.min))
+        np.matmul(counts, TEMP_TENTHS, out=out.sum_temp)
+        np.copyto(out.count, w_count)
+
+    def __worker_stats(self, worker_id: int) -> StationResult:
+        """Views onto `worker_id`'s row of the shared per-worker stats."""
+        n_stations = len(STATION_NAMES)
+        row = slice(worker_id * n_stations, (worker_id + 1) * n_stations)
+        return StationResult(
+            *(np.frombuffer(raw, dtype=np.int64)[row] for raw in self.shared_stats)
+        )
 
-            worker_result[name] = StationResult(
-                min_temp=float(w_min[idx]),
-                max_temp=float(w_max[idx]),
-                sum_temp=float(w_sum[idx]),
-                count=int(w_count[idx]),
-            )
+    def __rows_generated(self) -> int:
+        """Total rows written so far across all workers."""
+        return sum(self.progress_counters[::PROGRESS_STRIDE])
 
-        return_dict[worker_id] = worker_result
+    def __reserve(self, size: int) -> int:
+        """Claim the next `size` bytes of the output file and return their offset."""
+        with self.write_offset.get_lock():
+            offset = self.write_offset.value
+            self.write_offset.value += size
+        return offset
 
-    @staticmethod
-    def _get_batch_indices(batch_size: int) -> tuple[np.ndarray, np.ndarray]:
-        """Returns the indices for stations and temps from the global pool."""
-        start = np.random.randint(0, POOL_SIZE - batch_size + 1)
-        end = start + batch_size
-        return GLOBAL_STATION_INDICES[start:end], GLOBAL_TEMP_INDICES[start:end]
+    def __create_output_file(self):
+        """
+        Create (or truncate) the output file that all workers write into.
+
+        Space for the expected output is preallocated where the platform
+        supports it; the file is truncated to the bytes actually written once
+        the workers finish.
+        """
+        fd = os.open(
+            self.file_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        try:
+            if hasattr(os, "posix_fallocate") and self.num_rows > 0:
+                os.posix_fallocate(fd, 0, self.__estimate_file_size())
+        finally:
+            os.close(fd)
+
+    def __estimate_file_size(self) -> int:
+        """Expected output size given uniformly sampled stations and temps."""
+        avg_name = np.mean([len(name) for name in STATION_NAMES])
+        avg_temp = np.mean([len(temp) for temp in TEMP_LOOKUP])
+        return int(self.num_rows * (avg_name + avg_temp))
 
     @staticmethod
-    def _create_worker_batch(batch_size: int) -> bytes:
-        start = np.random.randint(0, POOL_SIZE - batch_size + 1)
-        end = start + batch_size
+    def _get_batch_indices(
+        rng: np.random.Generator, batch_size: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Draws fresh station and temp indices from the worker's generator."""
+        stations = rng.integers(
+            0, len(STATION_NAMES), size=batch_size, dtype=INDEX_DTYPE
+        )
+        temps = rng.integers(0, len(TEMP_LOOKUP), size=batch_size, dtype=INDEX_DTYPE)
+        return stations, temps
 
-        stations = GLOBAL_STATION_INDICES[start:end]
-        temps = GLOBAL_TEMP_INDICES[start:end]
+    @staticmethod
+    def _create_worker_batch(rng: np.random.Generator, batch_size: int) -> bytes:
+        stations, temps = FileGenerator._get_batch_indices(rng, batch_size)
+        parts = np.empty(2 * batch_size, dtype=object)
+        return FileGenerator._pack_rows(stations, temps, parts)
 
-        lines = STATION_NAMES[stations] + TEMP_LOOKUP[temps]
-        batch = b"".join(lines.tolist())
+    @staticmethod
+    def _pack_rows(
+        station_indices: np.ndarray, temp_indices: np.ndarray, parts: np.ndarray
+    ) -> bytes:
+        """
+        Join the station and temperature fragments for a batch into one buffer.
 
-        return batch
+        Fragments are interleaved into a single object array so the batch is
+        assembled by one join, rather than allocating a concatenated bytes
+        object per row first. `parts` is caller-owned scratch space with room
+        for at least two entries per row, reused across batches.
+        """
+        parts = parts[: 2 * len(station_indices)]
+        parts[0::2] = STATION_NAMES[station_indices]
+        parts[1::2] = TEMP_LOOKUP[temp_indices]
+        return b"".join(parts.tolist())
 
     def __print_start(self):
         print(f"\n{Colors.BOLD}{'='*70}{Colors.RESET}")
@@ -269,17 +403,20 @@ class FileGenerator:
         """
         Monitor progress of worker processes and print updates.
 
+        Waits on the process sentinels rather than sleeping, so this returns
+        as soon as the last worker exits instead of up to a tick later.
+
         Args:
             processes (list[mp.Process]): List of worker processes.
             start_time (float): Start time of the generation process.
         """
         last = 0
+        pending = {p.sentinel for p in processes}
 
-        while any(p.is_alive() for p in processes):
-            time.sleep(0.5)
+        while pending:
+            pending.difference_update(wait(pending, timeout=0.5))
 
-            with self.progress_lock:
-                curr = self.progress_counter.value
+            curr = self.__rows_generated()
 
             if curr - last >= self.monitor_threshold:
                 elapsed = time.time() - start_time
@@ -300,34 +437,16 @@ class FileGenerator:
             f"{Colors.MAGENTA}  >{Colors.RESET} {self.num_rows:,} rows {Colors.GREEN}(100.0%){Colors.RESET} - {elapsed:.1f}s - {Colors.CYAN}{rows_per_sec:,.0f} rows/s{Colors.RESET}"
         )
 
-    def __merge_temp_files(self, temp_files: list[str]):
-        """
-        Merge temporary files into the final output file.
-
-        Args:
-            temp_files (list[str]): List of temporary file paths.
+    def __print_final_stats(self, start_time: float, finalize_start: float):
         """
-        with open(self.file_path, "wb") as outfile:
-            for temp_file in temp_files:
-                with open(temp_file, "rb") as infile:
-                    while True:
-                        chunk = infile.read(1024 * 1024 * 10)  # 10MB chunks
-                        if not chunk:
-                            break
-                        outfile.write(chunk)
-
-                Path(temp_file).unlink()
-
-    def __print_final_stats(self, start_time: float, merge_start: float):
-        """
-        Print final statistics after generation and merging.
+        Print final statistics after generation and finalization.
 
         Args:
             start_time (float): Start time of the generation process.
-            merge_start (float): Start time of the merging process.
+            finalize_start (float): Start time of the finalization phase.
         """
-        generation_time = merge_start - start_time
-        merge_time = time.time() - merge_start
+        generation_time = finalize_start - start_time
+        finalize_time = time.time() - finalize_start
         total_time = time.time() - start_time
         file_size_mb = Path(self.file_path).stat().st_size / (1024 * 1024)
 
@@ -337,7 +456,7 @@ class FileGenerator:
             f"{Colors.BLUE}Generation time:{Colors.RESET} {Colors.BOLD}{generation_time:.2f}s{Colors.RESET}"
         )
         print(
-            f"{Colors.BLUE}Merge time:{Colors.RESET}     {Colors.BOLD}{merge_time:.2f}s{Colors.RESET}"
+            f"{Colors.BLUE}Finalize time:{Colors.RESET}   {Colors.BOLD}{finalize_time:.2f}s{Colors.RESET}"
         )
         print(
             f"{Colors.BLUE}Total time:{Colors.RESET}     {Colors.BOLD}{total_time:.2f}s{Colors.RESET}"
@@ -347,18 +466,21 @@ class FileGenerator:
         )
         print(f"{Colors.BOLD}{'='*70}{Colors.RESET}\n")
 
-    def __aggregate_stats(self, return_dict: DictProxy):
+    def __aggregate_stats(self):
         """Aggregate statistics from all workers."""
         print(
             f"\n{Colors.YELLOW}>> Aggregating statistics from workers...{Colors.RESET}"
         )
-        for worker_id in return_dict:
-            worker_stats = return_dict[worker_id]
-            for station_name, stats in worker_stats.items():
-                if station_name not in self.station_stats:
-                    self.station_stats[station_name] = copy.copy(stats)
-                else:
-                    self.station_stats[station_name].update(stats)
+        min_temp, max_temp, sum_temp, count = (
+            np.frombuffer(raw, dtype=np.int64).reshape(self.num_workers, -1)
+            for raw in self.shared_stats
+        )
+        self.station_stats = StationResult(
+            min_temp=min_temp.min(axis=0),
+            max_temp=max_temp.max(axis=0),
+            sum_temp=sum_temp.sum(axis=0),
+            count=count.sum(axis=0),
+        )
 
     def __write_results_csv(self):
         """Write aggregated statistics to results CSV file."""
@@ -378,13 +500,11 @@ class FileGenerator:
         if len(results) == 0:
             return
 
+        fieldnames = ["station", "min", "mean", "max"]
         with open(self.results_path, "w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = ["station", "min", "mean", "max"]
-            w = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            w.writeheader()
-            for row in results:
-                w.writerow(row)
+            w = csv.writer(csvfile)
+            w.writerow(fieldnames)
+            w.writerows([row[field] for field in fieldnames] for row in results)
 
         print(
             f"{Colors.GREEN}>> Results written to: {Colors.CYAN}{self.results_path}{Colors.RESET}"
@@ -392,14 +512,19 @@ class FileGenerator:
 
     def __prepare_csv_data(self) -> list[dict]:
         results = []
-        for station_name, stats in self.station_stats.items():
-            avg = stats.sum_temp / stats.count if stats.count > 0 else 0.0
+        stats = self.station_stats
+        if stats is None:
+            return results
+
+        for idx in np.flatnonzero(stats.count > 0):
+            raw_name: bytes = STATION_NAMES[idx]  # type: ignore[assignment]
+            avg = stats.sum_temp[idx] / stats.count[idx] / 10.0
             results.append(
                 {
-                    "station": station_name,
-                    "min": round(stats.min_temp, 1),
-                    "mean": round(avg, 1),
-                    "max": round(stats.max_temp, 1),
+                    "station": raw_name.decode("utf-8")[:-1],
+                    "min": int(stats.min_temp[idx]) / 10,
+                    "mean": round(float(avg), 1),
+                    "max": int(stats.max_temp[idx]) / 10,
                 }
             )
 
@@ -436,18 +561,21 @@ def main():
     filename = str(data_folder / f"measurements-{row_suffix}.txt")
     results_filename = str(results_folder / f"results-{row_suffix}.csv")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        FileGenerator(
-            num_rows=num_rows,
-            file_path=filename,
-            temp_folder=temp_dir,
-            num_workers=mp.cpu_count(),
-            monitor_threshold=5_000_000,
-            results_path=results_filename,
-            worker_batch_size=200_000,
-        ).start()
+    generator = FileGenerator(
+        num_rows=num_rows,
+        file_path=filename,
+        num_workers=mp.cpu_count(),
+        monitor_threshold=5_000_000,
+        results_path=results_filename,
+        worker_batch_size=200_000,
+    )
+    try:
+        generator.start()
+    except RuntimeError as e:
+        print(f"Error: {e}; output discarded")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
     mp.freeze_support()
-    main()
\ No newline at end of file
+    main()
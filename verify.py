@@ -12,45 +12,73 @@ This script:
 Usage:
     python verify.py [size]           # Verify specific size (e.g., 100k, 1m, 10m, 100m)
     python verify.py --all            # Verify all available files
+    python verify.py 1m --dump        # Also save calculated results to verify/
     python verify.py --help           # Show help message
 """
 
 import argparse
 import csv
+import math
+import mmap
 import multiprocessing as mp
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from fractions import Fraction
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+# Bytes of the mapped file handed to bytes.split at a time. Splitting a
+# block creates one bytes object per line, so this bounds a worker's peak
+# memory; larger blocks are no faster.
+SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Fork is cheapest where it is safe; other platforms keep spawn.
+MP_CONTEXT = mp.get_context("fork" if sys.platform == "linux" else "spawn")
 
 
 @dataclass
 class StationStats:
-    """Station statistics calculated from raw measurement data."""
+    """
+    Station statistics calculated from raw measurement data.
 
-    min_temp: float
-    max_temp: float
-    sum_temp: float
+    The *_tenths fields are integer tenths of a degree, so aggregation is
+    exact; the *_celsius properties convert back to degrees.
+    """
+
+    __slots__ = ("min_tenths", "max_tenths", "sum_tenths", "count")
+
+    min_tenths: int
+    max_tenths: int
+    sum_tenths: int
     count: int
 
-    def __post_init__(self):
-        """Initialize with extreme values if needed."""
-        if self.min_temp == float("inf"):
-            self.min_temp = 0.0
-        if self.max_temp == float("-inf"):
-            self.max_temp = 0.0
+    @property
+    def min_celsius(self) -> float:
+        """Minimum temperature in degrees."""
+        return self.min_tenths / 10
+
+    @property
+    def max_celsius(self) -> float:
+        """Maximum temperature in degrees."""
+        return self.max_tenths / 10
+
+    @property
+    def mean_celsius(self) -> float:
+        """Calculate mean temperature in degrees."""
+        return self.sum_tenths / (10.0 * self.count) if self.count > 0 else 0.0
 
     @property
     def mean_temp(self) -> float:
-        """Calculate mean temperature."""
-        return self.sum_temp / self.count if self.count > 0 else 0.0
+        """Mean temperature in degrees; alias of mean_celsius."""
+        return self.mean_celsius
 
     def merge(self, other: "StationStats") -> None:
         """Merge another StationStats into this one."""
-        self.min_temp = min(self.min_temp, other.min_temp)
-        self.max_temp = max(self.max_temp, other.max_temp)
-        self.sum_temp += other.sum_temp
+        self.min_tenths = min(self.min_tenths, other.min_tenths)
+        self.max_tenths = max(self.max_tenths, other.max_tenths)
+        self.sum_tenths += other.sum_tenths
         self.count += other.count
 
 
@@ -58,6 +86,8 @@ class StationStats:
 class ExpectedResult:
     """Expected result from the CSV file."""
 
+    __slots__ = ("station", "min_temp", "max_temp", "mean_temp")
+
     station: str
     min_temp: float
     max_temp: float
@@ -78,46 +108,159 @@ class VerificationResult:
     actual_mean: float = 0.0
 
 
+def parse_temperature(temp_str: bytes) -> int:
+    """
+    Parse a temperature reading into tenths of a degree.
+
+    Args:
+        temp_str: Temperature text, e.g. b"-12.3"
+
+    Returns:
+        Temperature in tenths of a degree, e.g. -123
+
+    Raises:
+        ValueError: If the text is not a finite number
+    """
+    temperature = float(temp_str)
+    if not math.isfinite(temperature):
+        raise ValueError(f"non-finite temperature: {temp_str!r}")
+    return round(temperature * 10)
+
+
+def aggregate_chunk(
+    file_path: str, start_byte: int, end_byte: int
+) -> Dict[bytes, list]:
+    """
+    Aggregate the measurements in a byte range of a file.
+
+    The per-row loop only touches bytes, ints, lists and dicts held in
+    locals, which keeps it cheap in CPython and lets PyPy's tracing JIT
+    compile it straight through.
+
+    Args:
+        file_path: Path to the measurement file
+        start_byte: Start of the byte range
+        end_byte: End of the byte range
+
+    Returns:
+        Dictionary mapping raw station names to [min, max, sum, count],
+        temperatures in tenths of a degree
+    """
+    stats: Dict[bytes, list] = {}
+    # Only a couple of thousand distinct readings exist, so each one is
+    # parsed once and looked up afterwards.
+    tenths: Dict[bytes, int] = {}
+
+    with open(file_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        # A chunk owns every line that starts inside [start_byte, end_byte)
+        start = _line_start(mm, start_byte)
+        end = _line_start(mm, end_byte)
+        _advise(mm, "MADV_SEQUENTIAL", start, end)
+
+        while start < end:
+            block_end = _line_start(mm, min(start + SCAN_BLOCK_SIZE, end))
+            # Start reading the next block in while this one is parsed
+            _advise(mm, "MADV_WILLNEED", block_end, block_end + SCAN_BLOCK_SIZE)
+
+            for line in mm[start:block_end].split(b"\n"):
+                station, sep, temp_str = line.partition(b";")
+                if not sep:
+                    continue
+                temp = tenths.get(temp_str)
+                if temp is None:
+                    try:
+                        temp = tenths[temp_str] = parse_temperature(temp_str)
+                    except ValueError:
+                        continue
+
+                # [min, max, sum, count]; list item stores are cheaper than
+                # attribute updates
+                s = stats.get(station)
+                if s is None:
+                    stats[station] = [temp, temp, temp, 1]
+                else:
+                    if temp < s[0]:
+                        s[0] = temp
+                    elif temp > s[1]:
+                        s[1] = temp
+                    s[2] += temp
+                    s[3] += 1
+
+            start = block_end
+
+    return stats
+
+
+def _advise(mm: mmap.mmap, option: str, start: int, end: int) -> None:
+    """
+    Give the kernel an access hint for a byte range of the mapping.
+
+    No-op on platforms or Python versions without the given madvise option.
+
+    Args:
+        mm: Mapped measurement file
+        option: Name of the mmap.MADV_* constant to apply
+        start: First byte of the range
+        end: End of the range (clamped to the file size)
+    """
+    advice = getattr(mmap, option, None)
+    if advice is None:
+        return
+    # madvise needs a page-aligned start
+    start -= start % mmap.PAGESIZE
+    end = min(end, len(mm))
+    if start < end:
+        mm.madvise(advice, start, end - start)
+
+
+def _line_start(mm: mmap.mmap, pos: int) -> int:
+    """
+    Find the first line that starts at or after `pos`.
+
+    Args:
+        mm: Mapped measurement file
+        pos: Byte offset into the file
+
+    Returns:
+        Offset of that line, or the file size if there is none
+    """
+    if pos <= 0:
+        return 0
+    newline = mm.find(b"\n", pos - 1)
+    return len(mm) if newline == -1 else newline + 1
+
+
 class MeasurementVerifier:
     """Fast, robust verification of measurement data against expected results."""
 
-    def __init__(self, tolerance: float = 0.1, workers: int = mp.cpu_count()):
+    def __init__(
+        self,
+        tolerance: float = 0.1,
+        workers: int = mp.cpu_count(),
+        dump_calculated: bool = False,
+    ):
         """
         Initialize verifier.
 
         Args:
             tolerance: Tolerance for float comparisons (degrees Celsius)
             workers: Number of worker processes (defaults to CPU count)
+            dump_calculated: Save calculated results to the verify folder
         """
         self.tolerance = tolerance
         self.workers = workers or mp.cpu_count()
+        self.dump_calculated = dump_calculated
         self.base_dir = Path(__file__).parent
         self.data_dir = self.base_dir / "data"
         self.results_dir = self.base_dir / "results"
         self.verify_dir = self.base_dir / "verify"
-
-
-        self.verify_dir.mkdir(exist_ok=True)
+        # Created on first use and shared by every file this verifier checks
+        self._executor: Optional[ProcessPoolExecutor] = None
 
     @staticmethod
-    def parse_line(line: str) -> Tuple[str | None, float | None]:
-        """
-        Parse a single measurement line.
-
-        Args:
-            line: Line in format "StationName;Temperature"
-
-        Returns:
-            Tuple of (station_name, temperature)
-        """
-        try:
-            station, temp_str = line.strip().split(";")
-            temperature = float(temp_str)
-            return station, temperature
-        except (ValueError, IndexError) as e:
-            return None, None
-
-    def process_chunk(self, args: Tuple[str, int, int]) -> Dict[str, StationStats]:
+    def process_chunk(args: Tuple[str, int, int]) -> Dict[str, StationStats]:
         """
         Process a chunk of the measurement file.
 
@@ -127,37 +270,11 @@ class MeasurementVerifier:
         Returns:
             Dictionary mapping station names to their statistics
         """
-        file_path, start_byte, end_byte = args
-        stats: Dict[str, StationStats] = {}
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            # Seek to start position
-            if start_byte > 0:
-                f.seek(start_byte)
-                # Skip partial line at the beginning (unless we're at file start)
-                f.readline()
-
-            while f.tell() < end_byte:
-                line = f.readline()
-                if not line:
-                    break
-
-                station, temp = self.parse_line(line)
-                if station is None or temp is None:
-                    continue
-
-                if station not in stats:
-                    stats[station] = StationStats(
-                        min_temp=temp, max_temp=temp, sum_temp=temp, count=1
-                    )
-                else:
-                    s = stats[station]
-                    s.min_temp = min(s.min_temp, temp)
-                    s.max_temp = max(s.max_temp, temp)
-                    s.sum_temp += temp
-                    s.count += 1
-
-        return stats
+        stats = aggregate_chunk(*args)
+        # Station names stay bytes in the hot loop and are decoded once here
+        return {
+            station.decode("utf-8"): StationStats(*s) for station, s in stats.items()
+        }
 
     def calculate_statistics(self, measurement_file: Path) -> Dict[str, StationStats]:
         """
@@ -183,21 +300,45 @@ class MeasurementVerifier:
                 break
             chunks.append((str(measurement_file), start, end))
 
-        # Process chunks in parallel
-        with mp.Pool(processes=len(chunks)) as pool:
-            chunk_results = pool.map(self.process_chunk, chunks)
+        # A single chunk is scanned in-process; a pool would only add
+        # process startup and result pickling on top of the same work.
+        if len(chunks) <= 1:
+            return self.process_chunk(chunks[0]) if chunks else {}
 
-        # Merge results from all chunks
+        # Process chunks in parallel, merging each result as soon as it
+        # arrives so the merge overlaps with chunks still being scanned
         merged_stats: Dict[str, StationStats] = {}
-        for chunk_stats in chunk_results:
+        executor = self._get_executor()
+        futures = [executor.submit(self.process_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            chunk_stats = future.result()
+            if not merged_stats:
+                # The first result is adopted as-is rather than copied
+                merged_stats = chunk_stats
+                continue
             for station, stats in chunk_stats.items():
-                if station not in merged_stats:
+                current = merged_stats.get(station)
+                if current is None:
                     merged_stats[station] = stats
                 else:
-                    merged_stats[station].merge(stats)
+                    current.merge(stats)
 
         return merged_stats
 
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=MP_CONTEXT
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def save_calculated_results(self, actual_stats: Dict[str, StationStats], size: str) -> None:
         """
         Save calculated statistics to CSV file in verify folder.
@@ -206,22 +347,26 @@ class MeasurementVerifier:
             actual_stats: Dictionary of calculated station statistics
             size: Dataset size (e.g., "1m", "10m", "100m")
         """
+        self.verify_dir.mkdir(exist_ok=True)
         output_file = self.verify_dir / f"results-{size}.csv"
 
         # Sort stations alphabetically
         sorted_stations = sorted(actual_stats.items(), key=lambda x: x[0])
 
-        with open(output_file, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['station', 'min', 'max', 'avg'])
+        rows = [
+            [
+                station,
+                f"{stats.min_celsius:.1f}",
+                f"{stats.max_celsius:.1f}",
+                f"{stats.mean_celsius:.1f}",
+            ]
+            for station, stats in sorted_stations
+        ]
 
-            for station, stats in sorted_stations:
-                writer.writerow([
-                    station,
-                    f"{stats.min_temp:.1f}",
-                    f"{stats.max_temp:.1f}",
-                    f"{stats.mean_temp:.1f}"
-                ])
+        with open(output_file, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["station", "min", "max", "avg"])
+            writer.writerows(rows)
 
         print(f"[OK] Saved calculated results to: {output_file}")
 
@@ -238,35 +383,62 @@ class MeasurementVerifier:
         """
         expected = {}
 
-        with open(results_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        with open(results_file, "r", encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return expected
+
+            # Resolve column positions once instead of building a dict per row
+            columns = {name: i for i, name in enumerate(header)}
+            # Handle both "avg" and "mean" column names
+            mean_col = columns.get("avg", columns.get("mean"))
+            if mean_col is None:
+                raise KeyError(
+                    f"CSV must have either 'avg' or 'mean' column. Found columns: {header}"
+                )
+            station_col = columns["station"]
+            min_col = columns["min"]
+            max_col = columns["max"]
+
             for row in reader:
-                station = row["station"]
-                # Handle both "avg" and "mean" column names
-                mean_val = row.get("avg") or row.get("mean")
-                if mean_val is None:
-                    raise KeyError(f"CSV must have either 'avg' or 'mean' column. Found columns: {row.keys()}")
+                # Blank lines come back as [], as DictReader would skip them
+                if not row:
+                    continue
+                station = row[station_col]
                 expected[station] = ExpectedResult(
                     station=station,
-                    min_temp=float(row["min"]),
-                    max_temp=float(row["max"]),
-                    mean_temp=float(mean_val),
+                    min_temp=float(row[min_col]),
+                    max_temp=float(row[max_col]),
+                    mean_temp=float(row[mean_col]),
                 )
 
         return expected
 
-    def compare_values(self, actual: float, expected: float) -> bool:
+    def compare_values(
+        self, actual: Fraction, expected: float, tolerance: Optional[Fraction] = None
+    ) -> bool:
         """
-        Compare two float values within tolerance.
+        Compare a calculated value with an expected one within tolerance.
+
+        The comparison is exact: the expected value and the tolerance are
+        taken as the decimals they are written as, so a difference of
+        exactly the tolerance is not decided by float rounding.
 
         Args:
-            actual: Actual calculated value
+            actual: Actual calculated value, exact
             expected: Expected value from CSV
+            tolerance: Exact tolerance; derived from self.tolerance if omitted
 
         Returns:
-            True if values match within tolerance
+            True if values match within tolerance; never for a nan or inf
+            expected value
         """
-        return abs(actual - expected) <= self.tolerance
+        if not math.isfinite(expected):
+            return False
+        if tolerance is None:
+            tolerance = Fraction(str(self.tolerance))
+        return abs(actual - Fraction(str(expected))) <= tolerance
 
     def verify_file(self, size: str) -> Tuple[bool, Dict]:
         """
@@ -304,7 +476,8 @@ class MeasurementVerifier:
         )
 
         # Save calculated results to verify folder
-        self.save_calculated_results(actual_stats, size)
+        if self.dump_calculated:
+            self.save_calculated_results(actual_stats, size)
 
         # Load expected results
         print("Loading expected results from CSV...")
@@ -317,7 +490,7 @@ class MeasurementVerifier:
         mismatches = []
         missing_in_actual = []
         extra_in_actual = []
-
+        tolerance = Fraction(str(self.tolerance))
         # Check all expected stations
         for station, expected in expected_results.items():
             if station not in actual_stats:
@@ -333,9 +506,18 @@ class MeasurementVerifier:
                 )
             else:
                 actual = actual_stats[station]
-                min_match = self.compare_values(actual.min_temp, expected.min_temp)
-                max_match = self.compare_values(actual.max_temp, expected.max_temp)
-                mean_match = self.compare_values(actual.mean_temp, expected.mean_temp)
+                # Aggregates are integer tenths, so these are exact
+                min_match = self.compare_values(
+                    Fraction(actual.min_tenths, 10), expected.min_temp, tolerance
+                )
+                max_match = self.compare_values(
+                    Fraction(actual.max_tenths, 10), expected.max_temp, tolerance
+                )
+                mean_match = self.compare_values(
+                    Fraction(actual.sum_tenths, 10 * actual.count),
+                    expected.mean_temp,
+                    tolerance,
+                )
 
                 if min_match and max_match and mean_match:
                     matches.append(station)
@@ -353,11 +535,11 @@ class MeasurementVerifier:
                             station=station,
                             status=f"{'+'.join(status_parts)}_MISMATCH",
                             expected_min=expected.min_temp,
-                            actual_min=actual.min_temp,
+                            actual_min=actual.min_celsius,
                             expected_max=expected.max_temp,
-                            actual_max=actual.max_temp,
+                            actual_max=actual.max_celsius,
                             expected_mean=expected.mean_temp,
-                            actual_mean=actual.mean_temp,
+                            actual_mean=actual.mean_celsius,
                         )
                     )
 
@@ -447,6 +629,7 @@ Examples:
   python verify.py 1m            # Verify 1m dataset
   python verify.py --all         # Verify all available datasets
   python verify.py --tolerance 0.5  # Use custom tolerance
+  python verify.py 1m --dump     # Also save calculated results to verify/
         """,
     )
     parser.add_argument(
@@ -464,6 +647,11 @@ Examples:
     parser.add_argument(
         "--workers", type=int, help="Number of worker processes (default: CPU count)"
     )
+    parser.add_argument(
+        "--dump",
+        action="store_true",
+        help="Save the calculated results to verify/results-<size>.csv",
+    )
 
     args = parser.parse_args()
 
@@ -473,7 +661,9 @@ Examples:
         sys.exit(1)
 
     # Create verifier
-    verifier = MeasurementVerifier(tolerance=args.tolerance, workers=args.workers)
+    verifier = MeasurementVerifier(
+        tolerance=args.tolerance, workers=args.workers, dump_calculated=args.dump
+    )
 
     # Determine which files to verify
     if args.all:
@@ -489,10 +679,13 @@ Examples:
     results = {}
     overall_success = True
 
-    for size in sizes:
-        success, stats = verifier.verify_file(size)
-        results[size] = stats
-        overall_success = overall_success and success
+    try:
+        for size in sizes:
+            success, stats = verifier.verify_file(size)
+            results[size] = stats
+            overall_success = overall_success and success
+    finally:
+        verifier.close()
 
     # Print summary if multiple files
     if len(sizes) > 1: